@@ -9,6 +9,30 @@ from .settings_ui import SettingsPageUI
 
 from dataclasses import asdict, is_dataclass
 
+
+def track_widget_changes(root: QtWidgets.QWidget, slot):
+    """
+    Connect the change signal of every input widget under ``root`` to ``slot``.
+
+    Used to invalidate settings derived from the widgets (see
+    SettingsPage.settings_version) without listing each widget by hand.
+    """
+    for combo in root.findChildren(QtWidgets.QComboBox):
+        combo.currentTextChanged.connect(slot)
+    for spinbox in root.findChildren(QtWidgets.QAbstractSpinBox):
+        if isinstance(spinbox, (QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+            spinbox.valueChanged.connect(slot)
+    for button in root.findChildren(QtWidgets.QAbstractButton):
+        if button.isCheckable():
+            button.toggled.connect(slot)
+    for line_edit in root.findChildren(QtWidgets.QLineEdit):
+        line_edit.textChanged.connect(slot)
+    for text_edit in root.findChildren(QtWidgets.QTextEdit):
+        text_edit.textChanged.connect(slot)
+    for text_edit in root.findChildren(QtWidgets.QPlainTextEdit):
+        text_edit.textChanged.connect(slot)
+
+
 class SettingsPage(QtWidgets.QWidget):
     theme_changed = Signal(str)
     font_imported = Signal(str)
@@ -20,6 +44,11 @@ class SettingsPage(QtWidgets.QWidget):
         self._setup_connections()
         self._loading_settings = False
 
+        # Bumped whenever any setting widget changes, so values derived
+        # from the settings can be cached until the user edits something
+        self.settings_version = 0
+        track_widget_changes(self.ui, self._bump_settings_version)
+
         layout = QtWidgets.QVBoxLayout()
         layout.addWidget(self.ui)
         self.setLayout(layout)
@@ -30,6 +59,9 @@ class SettingsPage(QtWidgets.QWidget):
         self.ui.lang_combo.currentTextChanged.connect(self.on_language_changed)
         self.ui.font_browser.sig_files_changed.connect(self.import_font)
 
+    def _bump_settings_version(self, *args):
+        self.settings_version += 1
+
     def on_theme_changed(self, theme: str):
         self.theme_changed.emit(theme)
 
@@ -1,7 +1,19 @@
 import os, sys
 import re
+import ctypes
+from functools import lru_cache
+
+# These must be set before torch is first imported: the CUDA runtime reads
+# them when the context is created and ignores later changes.
+# Load CUDA kernels on first use instead of all of torch/cuDNN up front
+os.environ.setdefault("CUDA_MODULE_LOADING", "LAZY")
+# Keep JIT-compiled PTX between runs (the default cache is too small for torch)
+os.environ.setdefault("CUDA_CACHE_MAXSIZE", str(2 * 1024 * 1024 * 1024))
 
 # --- Manually add potential NVIDIA paths --- START
+_CUDA_PATH_MARKER = "nvidia gpu computing toolkit"
+_CUDA_PATH_RE = re.compile(r"nvidia gpu computing toolkit\\cuda\\v(\d+\.\d+)", re.IGNORECASE)
+
 def adjust_nvidia_paths():
     print("--- NVIDIA Path Adjustment --- START")
     TARGET_CUDA_VERSION = "12.1"
@@ -14,6 +26,7 @@ def adjust_nvidia_paths():
 
     current_path = os.environ.get('PATH', '')
     current_path_list = current_path.split(os.pathsep)
+    current_path_set = set(current_path_list)
     print(f"Original PATH (first 300 chars): {current_path[:300]}...")
 
     paths_to_prepend = []
@@ -22,7 +35,7 @@ def adjust_nvidia_paths():
         if os.path.isdir(path):
             found_target_paths_exist = True
             print(f"Target CUDA {TARGET_CUDA_VERSION} path found: {path}")
-            if path not in current_path_list:
+            if path not in current_path_set:
                 print(f"  -> Adding {name} path to PATH.")
                 paths_to_prepend.append(path)
             else:
@@ -30,7 +43,7 @@ def adjust_nvidia_paths():
         else:
             print(f"Target CUDA {TARGET_CUDA_VERSION} path NOT found: {path}")
             
-    if os.path.isdir(nvidia_smi_path) and nvidia_smi_path not in current_path_list:
+    if os.path.isdir(nvidia_smi_path) and nvidia_smi_path not in current_path_set:
          print(f"NVSMI path found and not in PATH, adding: {nvidia_smi_path}")
          paths_to_prepend.append(nvidia_smi_path)
 
@@ -40,9 +53,11 @@ def adjust_nvidia_paths():
 
     # Check for other CUDA versions in PATH
     other_cuda_versions = set()
-    cuda_path_pattern = re.compile(r"nvidia gpu computing toolkit\\cuda\\v(\d+\.\d+)", re.IGNORECASE)
     for p in current_path_list:
-        match = cuda_path_pattern.search(p)
+        # Cheap substring check first; only CUDA toolkit entries need the regex
+        if _CUDA_PATH_MARKER not in p.lower():
+            continue
+        match = _CUDA_PATH_RE.search(p)
         if match:
             version = match.group(1)
             if version != TARGET_CUDA_VERSION:
@@ -64,70 +79,117 @@ def adjust_nvidia_paths():
 adjust_nvidia_paths() # Run the adjustment
 # --- Manually add potential NVIDIA paths --- END
 
-# --- Early CUDA Check --- START
-try:
-    import torch
-    print(f"PyTorch Location: {torch.__file__}") # Print where torch is imported from
-    print(f"Attempting torch.cuda.is_available()...")
-    cuda_available = torch.cuda.is_available()
-    print(f"torch.cuda.is_available() returned: {cuda_available}")
-    if cuda_available:
-        print("Early CUDA Check: CUDA IS AVAILABLE. Initializing...")
-        torch.cuda.init()
-        device_count = torch.cuda.device_count()
-        print(f"Early CUDA Check: Device Count: {device_count}")
-        if device_count > 0:
-            print(f"Early CUDA Check: Device Name (GPU 0): {torch.cuda.get_device_name(0)}")
-    else:
-        # Add more diagnostics if CUDA not available
-        print("Early CUDA Check: CUDA NOT AVAILABLE according to torch.cuda.is_available()")
-        cuda_version_compiled = getattr(torch.version, 'cuda', 'N/A')
-        print(f"  PyTorch was compiled with CUDA version: {cuda_version_compiled}")
-        try:
-            import ctypes
-            # Define TARGET_CUDA_VERSION within this scope or pass it
-            _TARGET_CUDA_VERSION_DIAG = "12.1" # Quick fix: redefine locally for diagnostics
-            cudart_paths = (
-                f"C:\\Program Files\\NVIDIA GPU Computing Toolkit\\CUDA\\v{_TARGET_CUDA_VERSION_DIAG}\\bin\\cudart64_*.dll", # Check target version
-                "C:\\Windows\\System32\\cudart64_*.dll", # Check system path
-                r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA\v*\bin\cudart64_*.dll" # Check any version
-            )
-            found_cudart = False
-            for pattern in cudart_paths:
-                import glob
-                libs = glob.glob(pattern)
-                if libs:
-                    print(f"  Found CUDA Runtime library matching {pattern}: {libs[0]}")
-                    try:
-                        ctypes.CDLL(libs[0])
-                        print(f"    -> Successfully loaded {libs[0]} via ctypes.")
-                        found_cudart = True
-                        break # Stop after finding one
-                    except Exception as load_err:
-                        print(f"    -> Failed to load {libs[0]} via ctypes: {load_err}")
-            if not found_cudart:
-                 print("  Could not find or load a suitable CUDA Runtime library (cudart64_*.dll). Check CUDA Toolkit installation and PATH.")
-        except Exception as diag_err:
-            print(f"  Error during diagnostic check for cudart: {diag_err}")
-
-except ImportError:
-    print("Early CUDA Check: PyTorch module not found.")
-except Exception as e:
-    print(f"Early CUDA Check: Error during PyTorch CUDA check/initialization: {e}")
-# --- Early CUDA Check --- END
+# --- CUDA Diagnostics --- START
+def diagnose_cuda():
+    # torch is only imported here so a normal launch doesn't pay for loading
+    # the CUDA libraries before a GPU model is actually needed
+    try:
+        import torch
+        from modules.utils.device import ensure_cuda_ready
+        print(f"PyTorch Location: {torch.__file__}") # Print where torch is imported from
+        if not ensure_cuda_ready():
+            # Add more diagnostics if CUDA not available
+            cuda_version_compiled = getattr(torch.version, 'cuda', 'N/A')
+            print(f"  PyTorch was compiled with CUDA version: {cuda_version_compiled}")
+            try:
+                # Define TARGET_CUDA_VERSION within this scope or pass it
+                _TARGET_CUDA_VERSION_DIAG = "12.1" # Quick fix: redefine locally for diagnostics
+                # Probe by name and let the Windows loader resolve it from the
+                # search path (which adjust_nvidia_paths has already fixed up).
+                # Never scan System32 or other toolkit versions: that can pin a
+                # stale cudart into the process.
+                cudart_names = dict.fromkeys((
+                    f"cudart64_{_TARGET_CUDA_VERSION_DIAG.replace('.', '')}.dll", # Target version
+                    "cudart64_121.dll",
+                    "cudart64_12.dll",
+                ))
+                if sys.platform != "win32":
+                    print("  Skipping CUDA Runtime library probe (Windows only).")
+                else:
+                    found_cudart = False
+                    for name in cudart_names:
+                        try:
+                            ctypes.WinDLL(name)
+                            print(f"  Successfully loaded CUDA Runtime library {name} via ctypes.")
+                            found_cudart = True
+                            break # Stop after finding one
+                        except OSError as load_err:
+                            print(f"  Could not load {name}: {load_err}")
+                    if not found_cudart:
+                         print("  Could not find or load a suitable CUDA Runtime library (cudart64_*.dll). Check CUDA Toolkit installation and PATH.")
+            except Exception as diag_err:
+                print(f"  Error during diagnostic check for cudart: {diag_err}")
+
+    except ImportError:
+        print("CUDA Check: PyTorch module not found.")
+    except Exception as e:
+        print(f"CUDA Check: Error during PyTorch CUDA check: {e}")
+
+# Opt in with --diagnose-cuda or COMIC_DIAGNOSE=1
+if "--diagnose-cuda" in sys.argv or os.environ.get("COMIC_DIAGNOSE"):
+    if "--diagnose-cuda" in sys.argv:
+        sys.argv.remove("--diagnose-cuda")
+    diagnose_cuda()
+# --- CUDA Diagnostics --- END
 
 from PySide6.QtGui import QIcon
 from PySide6.QtCore import QSettings, QTranslator, QLocale
 from PySide6.QtWidgets import QApplication  
 
-from controller import ComicTranslate
 from app.translations import ct_translations
 from app import icon_resource
 
+# Chinese locales map to a script rather than just a language
+_ZH_LOCALE_MAP = {
+    'zh_CN': '简体中文',
+    'zh_SG': '简体中文',
+    'zh_TW': '繁體中文',
+    'zh_HK': '繁體中文',
+}
+
+# Map the system language code to the application's language names
+_SYS_LANG_MAP = {
+    'en': 'English',
+    'ko': '한국어',
+    'fr': 'Français',
+    'ja': '日本語',
+    'ru': 'русский',
+    'de': 'Deutsch',
+    'nl': 'Nederlands',
+    'es': 'Español',
+    'it': 'Italiano',
+    'tr': 'Türkçe',
+    'ka': 'ქართული'
+}
+
+# Map the application's language names to translation file codes
+_LANG_CODE_MAP = {
+    'English': 'en',
+    '한국어': 'ko',
+    'Français': 'fr',
+    '日本語': 'ja',
+    '简体中文': 'zh_CN',
+    '繁體中文': 'zh_TW',
+    'русский': 'ru',
+    'Deutsch': 'de',
+    'Nederlands': 'nl',
+    'Español': 'es',
+    'Italiano': 'it',
+    'Türkçe': 'tr',
+    'ქართული': 'ka'
+}
+
+def __getattr__(name):
+    # controller pulls in the whole detection/OCR/inpainting stack (torch,
+    # transformers, opencv), so only import it when it is actually used
+    if name == "ComicTranslate":
+        from controller import ComicTranslate
+        return ComicTranslate
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def main():
     if sys.platform == "win32":
         # Necessary Workaround to set Taskbar Icon on Windows
-        import ctypes
         myappid = u'ComicLabs.ComicTranslate' # arbitrary string
         ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
 
@@ -143,6 +205,9 @@ def main():
     if selected_language != 'English':
         load_translation(app, selected_language)  
 
+    # Imported after QApplication exists so the heavy model stack isn't
+    # loaded before Qt has started
+    from controller import ComicTranslate
     ct = ComicTranslate()
 
     # Check for file arguments
@@ -157,53 +222,22 @@ def main():
     sys.exit(app.exec())
 
 
+@lru_cache(maxsize=1)
 def get_system_language():
     locale = QLocale.system().name()  # Returns something like "en_US" or "zh_CN"
     
     # Special handling for Chinese
-    if locale.startswith('zh_'):
-        if locale in ['zh_CN', 'zh_SG']:
-            return '简体中文'
-        elif locale in ['zh_TW', 'zh_HK']:
-            return '繁體中文'
+    if locale in _ZH_LOCALE_MAP:
+        return _ZH_LOCALE_MAP[locale]
     
     # For other languages, we can still use the first part of the locale
     lang_code = locale.split('_')[0]
     
-    # Map the system language code to your application's language names
-    lang_map = {
-        'en': 'English',
-        'ko': '한국어',
-        'fr': 'Français',
-        'ja': '日本語',
-        'ru': 'русский',
-        'de': 'Deutsch',
-        'nl': 'Nederlands',
-        'es': 'Español',
-        'it': 'Italiano',
-        'tr': 'Türkçe',
-        'ka': 'ქართული'
-    }
-    
-    return lang_map.get(lang_code, 'English')  # Default to English if not found
+    return _SYS_LANG_MAP.get(lang_code, 'English')  # Default to English if not found
 
 def load_translation(app, language: str):
     translator = QTranslator(app)
-    lang_code = {
-        'English': 'en',
-        '한국어': 'ko',
-        'Français': 'fr',
-        '日本語': 'ja',
-        '简体中文': 'zh_CN',
-        '繁體中文': 'zh_TW',
-        'русский': 'ru',
-        'Deutsch': 'de',
-        'Nederlands': 'nl',
-        'Español': 'es',
-        'Italiano': 'it',
-        'Türkçe': 'tr',
-        'ქართული': 'ka'
-    }.get(language, 'en')
+    lang_code = _LANG_CODE_MAP.get(language, 'en')
 
     # Load the translation file
     # if translator.load(f"ct_{lang_code}", "app/translations/compiled"):
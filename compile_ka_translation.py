@@ -3,6 +3,26 @@ import subprocess
 import sys
 from pathlib import Path
 
+def find_lrelease():
+    # Locate the lrelease binary: pip wheels ship it next to the PySide6
+    # package, other installs under Qt's binaries/libexec directories
+    exe_name = "lrelease.exe" if sys.platform == "win32" else "lrelease"
+    try:
+        import PySide6
+        from PySide6.QtCore import QLibraryInfo
+    except ImportError:
+        return "lrelease"  # Fall back to system lrelease
+
+    candidates = [
+        Path(PySide6.__file__).resolve().parent / exe_name,  # pip wheels
+        Path(QLibraryInfo.path(QLibraryInfo.LibraryPath.BinariesPath)) / exe_name,
+        Path(QLibraryInfo.path(QLibraryInfo.LibraryPath.LibraryExecutablesPath)) / exe_name,
+    ]
+    for candidate in candidates:
+        if candidate.exists():
+            return str(candidate)
+    return "lrelease"  # Try using system lrelease
+
 def main():
     # Get the directory of the script
     script_dir = Path(os.path.dirname(os.path.abspath(__file__)))
@@ -19,16 +39,7 @@ def main():
         return 1
     
     try:
-        # Try to use lrelease from PySide6
-        try:
-            from PySide6.QtCore import QLibraryInfo
-            lrelease_path = QLibraryInfo.path(QLibraryInfo.LibraryExecutables) + "/lrelease"
-            if not os.path.exists(lrelease_path) and sys.platform == "win32":
-                lrelease_path += ".exe"
-            if not os.path.exists(lrelease_path):
-                lrelease_path = "lrelease"  # Try using system lrelease
-        except ImportError:
-            lrelease_path = "lrelease"  # Fall back to system lrelease
+        lrelease_path = find_lrelease()
         
         print(f"Using lrelease at: {lrelease_path}")
         
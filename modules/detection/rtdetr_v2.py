@@ -7,6 +7,7 @@ from transformers import RTDetrV2ForObjectDetection, RTDetrImageProcessor
 
 from .base import DetectionEngine
 from ..utils.textblock import TextBlock
+from ..utils.device import cuda_available
 from .utils.slicer import ImageSlicer
 
 
@@ -49,7 +50,7 @@ class RTDetrV2Detection(DetectionEngine):
             )
             
             # Move model to appropriate device
-            if self.device == 'cuda' and torch.cuda.is_available():
+            if self.device == 'cuda' and cuda_available():
                 self.model = self.model.to('cuda')
     
     def detect(self, image: np.ndarray) -> list[TextBlock]:
@@ -78,7 +79,7 @@ class RTDetrV2Detection(DetectionEngine):
         inputs = self.processor(images=pil_image, return_tensors="pt")
         
         # Move inputs to device
-        if self.device == "cuda" and torch.cuda.is_available():
+        if self.device == "cuda" and cuda_available():
             inputs = {k: v.to("cuda") for k, v in inputs.items()}
         
         # Run inference
@@ -87,7 +88,7 @@ class RTDetrV2Detection(DetectionEngine):
         
         # Post-process results
         target_sizes = torch.tensor([pil_image.size[::-1]])
-        if self.device == "cuda" and torch.cuda.is_available():
+        if self.device == "cuda" and cuda_available():
             target_sizes = target_sizes.to("cuda")
             
         results = self.processor.post_process_object_detection(
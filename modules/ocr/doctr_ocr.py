@@ -1,8 +1,8 @@
 import numpy as np
-import torch
 
 from .base import OCREngine
 from ..utils.textblock import TextBlock
+from ..utils.device import cuda_available
 from ..utils.pipeline_utils import lists_to_blk_list
 
 
@@ -33,7 +33,7 @@ class DocTROCR(OCREngine):
             )
 
             # Move model to appropriate device after creation
-            if device == 'cuda' and torch.cuda.is_available():
+            if device == 'cuda' and cuda_available():
                 self.model.cuda().half()
         
     def process_image(self, img: np.ndarray, blk_list: list[TextBlock]) -> list[TextBlock]:
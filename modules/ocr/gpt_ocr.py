@@ -1,14 +1,28 @@
 import base64
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
-import requests
 import json
 
 from .base import OCREngine
 from ..utils.textblock import TextBlock, adjust_text_line_coordinates
 from ..utils.translator_utils import MODEL_MAP
+from ..utils.http_session import create_session, create_http2_client, post_with_retry
+from ..utils import fast_json
+from ..utils.api_errors import format_api_error
 
 
+# Shared, read-only prompt part of every OCR request
+_OCR_PROMPT = {"type": "text", "text": "Write out the text in this image. Do NOT Translate. Do not write anything else"}
+
+# Prompt used when several crops are sent in one request
+_BATCH_SEPARATOR = "###"
+_BATCH_OCR_PROMPT = (
+    "Write out the text in each of these {count} images, in order. Do NOT Translate. "
+    f"Separate the text of each image with a line containing only {_BATCH_SEPARATOR}. "
+    "If an image has no text, leave its entry empty. Do not write anything else"
+)
+
 class GPTOCR(OCREngine):
     """OCR engine using GPT vision capabilities via direct REST API calls."""
     
@@ -18,6 +32,17 @@ class GPTOCR(OCREngine):
         self.model = 'GPT-4o'
         self.api_base_url = 'https://api.openai.com/v1/chat/completions'
         self.max_tokens = 5000
+        self.timeout = (5, 60)  # (connect, read) seconds
+        self.max_parallel = 6  # Concurrent requests, kept low for API rate limits
+        self.batch_size = 10  # Crops per request, kept small to stay within context limits
+        self.jpeg_quality = 85
+        self.min_jpeg_side = 64  # Smaller crops are sent as PNG
+        self.max_image_side = 1024  # Larger crops are downscaled before encoding
+        self._headers = None
+        # Prefer HTTP/2 so concurrent batches share one connection;
+        # fall back to a pooled requests session without httpx
+        self._client = create_http2_client(*self.timeout)
+        self._session = create_session() if self._client is None else None
         
     def initialize(self, api_key: str, model: str = 'GPT-4o', 
                   expansion_percentage: int = 0) -> None:
@@ -30,6 +55,10 @@ class GPTOCR(OCREngine):
             expansion_percentage: Percentage to expand text bounding boxes
         """
         self.api_key = api_key
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
         self.model = MODEL_MAP.get(model)
         self.expansion_percentage = expansion_percentage
         
@@ -44,6 +73,8 @@ class GPTOCR(OCREngine):
         Returns:
             List of updated TextBlock objects with recognized text
         """
+        # Crop and encode every block first, then send the requests concurrently
+        pending = []
         for blk in blk_list:
             try:
                 # Get box coordinates
@@ -61,65 +92,150 @@ class GPTOCR(OCREngine):
                 if x1 < x2 and y1 < y2 and x1 >= 0 and y1 >= 0 and x2 <= img.shape[1] and y2 <= img.shape[0]:
                     # Crop image and encode
                     cropped_img = img[y1:y2, x1:x2]
-                    cv2_to_gpt = cv2.imencode('.png', cropped_img)[1]
-                    cv2_to_gpt = base64.b64encode(cv2_to_gpt).decode('utf-8')
-                    
-                    # Get OCR result from GPT
-                    blk.text = self._get_gpt_ocr(cv2_to_gpt)
+                    pending.append((blk, self._encode_crop(cropped_img)))
             except Exception as e:
                 print(f"GPT OCR error on block: {str(e)}")
                 blk.text = ""
+
+        if not pending:
+            return blk_list
+
+        # Several crops go into one request, and the requests are I/O bound,
+        # so threads overlap the network latency of the batches
+        batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        max_workers = min(self.max_parallel, len(batches))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (batch, executor.submit(self._ocr_batch, [image_url for _, image_url in batch]))
+                for batch in batches
+            ]
+            for batch, future in futures:
+                try:
+                    texts = future.result()
+                except Exception as e:
+                    print(f"GPT OCR error on block: {str(e)}")
+                    texts = [""] * len(batch)
+                for (blk, _), text in zip(batch, texts):
+                    blk.text = text
                 
         return blk_list
     
-    def _get_gpt_ocr(self, base64_image: str) -> str:
+    def _encode_crop(self, cropped_img: np.ndarray) -> str:
+        """
+        Encode a cropped text region as a base64 data URI for the vision API.
+        
+        JPEG is much cheaper to encode and upload than PNG, and the model
+        doesn't need lossless input. Very small crops stay PNG so JPEG
+        artifacts don't eat thin text strokes, and very large ones are
+        downscaled first.
+        
+        Args:
+            cropped_img: Cropped image region
+            
+        Returns:
+            Data URI containing the encoded image
+        """
+        h, w = cropped_img.shape[:2]
+        # The vision model downsamples large inputs anyway, so shrink oversized
+        # crops before encoding; INTER_AREA keeps the text legible
+        max_side = max(h, w)
+        if max_side > self.max_image_side:
+            scale = self.max_image_side / max_side
+            cropped_img = cv2.resize(cropped_img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            h, w = cropped_img.shape[:2]
+        
+        if min(h, w) < self.min_jpeg_side:
+            success, buffer = cv2.imencode('.png', cropped_img)
+            mime_type = 'image/png'
+        else:
+            success, buffer = cv2.imencode('.jpg', cropped_img, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality])
+            mime_type = 'image/jpeg'
+        if not success:
+            raise ValueError(f"Failed to encode image as {mime_type}")
+        
+        # b64encode reads the encoded ndarray through the buffer protocol,
+        # so no intermediate bytes copy is made. Base64 output is pure ASCII.
+        return f"data:{mime_type};base64,{base64.b64encode(buffer).decode('ascii')}"
+    
+    def _ocr_batch(self, image_urls: list[str]) -> list[str]:
+        """
+        OCR several crops with a single request, falling back to one request
+        per crop if the model doesn't return one result per image.
+        
+        Args:
+            image_urls: Base64 data URIs of the crops (see _encode_crop)
+            
+        Returns:
+            OCR result text for each crop, in order
+        """
+        if len(image_urls) == 1:
+            return [self._get_gpt_ocr(image_urls[0])]
+        
+        content = [{"type": "text", "text": _BATCH_OCR_PROMPT.format(count=len(image_urls))}]
+        content.extend({"type": "image_url", "image_url": {"url": url}} for url in image_urls)
+        text = self._request_ocr(content)
+        
+        # A failed request gets the same result it would have had per block
+        if not text or text.startswith("[OCR Error"):
+            return [text] * len(image_urls)
+        
+        # Tolerate a separator before the first or after the last entry
+        text = text.strip()
+        text = text.removeprefix(_BATCH_SEPARATOR).removesuffix(_BATCH_SEPARATOR)
+        texts = [t.strip() for t in text.split(_BATCH_SEPARATOR)]
+        if len(texts) != len(image_urls):
+            print(f"GPT OCR batch returned {len(texts)} results for {len(image_urls)} images, retrying per block")
+            return [self._get_gpt_ocr(url) for url in image_urls]
+        
+        return [t.replace('\n', ' ') for t in texts]
+    
+    def _get_gpt_ocr(self, image_url: str) -> str:
         """
         Get OCR result from GPT model using direct REST API call.
         
         Args:
-            base64_image: Base64 encoded image
+            image_url: Base64 data URI of the image (see _encode_crop)
             
         Returns:
             OCR result text
         """
+        text = self._request_ocr([_OCR_PROMPT, {"type": "image_url", "image_url": {"url": image_url}}])
+        # Replace newlines with spaces
+        return text.replace('\n', ' ')
+    
+    def _request_ocr(self, content: list[dict]) -> str:
+        """
+        Send a single chat completion request with the given message content.
+        
+        Args:
+            content: Content parts (prompt and images) of the user message
+            
+        Returns:
+            Response text, or an empty string if the request failed
+        """
         if not self.api_key:
             raise ValueError("API key not initialized. Call initialize() first.")
             
         try:
-            # Prepare request headers
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
-            
             # Prepare request payload
             payload = {
                 "model": self.model,
                 "messages": [
                     {
                         "role": "user",
-                        "content": [
-                            {"type": "text", "text": "Write out the text in this image. Do NOT Translate. Do not write anything else"},
-                            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{base64_image}"}}
-                        ]
+                        "content": content
                     }
                 ],
                 "max_tokens": self.max_tokens
             }
             
             # Make POST request to OpenAI API
-            response = requests.post(
-                self.api_base_url,
-                headers=headers,
-                data=json.dumps(payload)
-            )
+            response = self._post(fast_json.dumps(payload))
             
             # Parse response
             if response.status_code == 200:
-                response_json = response.json()
-                text = self._extract_text_from_response(response_json)
-                # Replace newlines with spaces
-                return text.replace('\n', ' ') if '\n' in text else text
+                response_json = fast_json.loads(response.content)
+                return self._extract_text_from_response(response_json)
             else:
                 print(f"API error: {response.status_code} {response.text}")
                 return ""
@@ -128,6 +244,22 @@ class GPTOCR(OCREngine):
             print(f"GPT API request error: {str(e)}")
             return ""
             
+    def _post(self, body: bytes):
+        """
+        POST a JSON body to the API over the shared HTTP/2 client, or the
+        pooled requests session when httpx isn't available.
+        
+        Args:
+            body: Serialized JSON payload
+            
+        Returns:
+            Response object (httpx and requests expose the same fields used here)
+        """
+        if self._client is not None:
+            # The transport only retries connection errors; rate limits and 5xx are retried here
+            return post_with_retry(self._client, self.api_base_url, headers=self._headers, content=body)
+        return self._session.post(self.api_base_url, headers=self._headers, data=body, timeout=self.timeout)
+    
     def _extract_text_from_response(self, response_data):
         """
         Extract text from API response, handling different response formats.
@@ -140,16 +272,7 @@ class GPTOCR(OCREngine):
         """
         # First check for error responses
         if "error" in response_data:
-            error_info = response_data["error"]
-            error_message = error_info.get("message", "Unknown API error")
-            error_code = error_info.get("code", "unknown")
-            
-            # Handle rate limiting specifically
-            if error_code == 429 or "rate limit" in error_message.lower():
-                provider = error_info.get("metadata", {}).get("provider_name", "API provider")
-                error_msg = f"Rate limit exceeded for {provider}: {error_message}"
-            else:
-                error_msg = f"API error ({error_code}): {error_message}"
+            error_msg = format_api_error(response_data["error"])
                 
             print(f"API error during OCR: {error_msg}")
             return f"[OCR Error: {error_msg}]"
@@ -176,34 +176,53 @@ def pyside_word_wrap(text: str, font_input: str, roi_width: int, roi_height: int
     """Break long text to multiple lines, and reduce point size
     until all text fits within a bounding box."""
     
+    # The fit search below measures the same strings over and over (every font
+    # size retries the same column counts), so fonts, wrapped strings and
+    # measurements are kept for the duration of this call.
+    fonts = {}
+    wrapped = {}
+    metrics = {}
+
     def prepare_font(font_size):
-        font = QFont(font_input, font_size)
-        font.setBold(bold)
-        font.setItalic(italic)
-        font.setUnderline(underline)
+        font = fonts.get(font_size)
+        if font is None:
+            font = QFont(font_input, font_size)
+            font.setBold(bold)
+            font.setItalic(italic)
+            font.setUnderline(underline)
+            fonts[font_size] = font
 
         return font
-    
+
+    def wrap_text(columns: int) -> str:
+        # The wrapped text only depends on the column count, not the font size
+        wrapped_text = wrapped.get(columns)
+        if wrapped_text is None:
+            wrapped_text = wrapped[columns] = '\n'.join(hyphen_wrap(text, columns, break_on_hyphens=False, break_long_words=False, hyphenate_broken_words=True))
+        return wrapped_text
+
+    # One document is reused for every measurement
+    doc = QTextDocument()
+    text_option = QTextOption()
+    text_option.setTextDirection(direction)
+    doc.setDefaultTextOption(text_option)
+    block_format = QTextBlockFormat()
+    spacing = line_spacing * 100
+    block_format.setLineHeight(spacing, QTextBlockFormat.LineHeightTypes.ProportionalHeight.value)
+    block_format.setAlignment(alignment)
+
     def eval_metrics(txt: str, font_sz: float) -> Tuple[float, float]:
         """Quick helper function to calculate width/height of text using QTextDocument."""
-        
-        # Create a QTextDocument
-        doc = QTextDocument()
+        key = (txt, font_sz)
+        if key in metrics:
+            return metrics[key]
+
         doc.setDefaultFont(prepare_font(font_sz))
         doc.setPlainText(txt)
 
-        # Set text direction
-        text_option = QTextOption()
-        text_option.setTextDirection(direction)
-        doc.setDefaultTextOption(text_option)
-        
-        # Apply line spacing
+        # Apply line spacing (setPlainText resets the block formats)
         cursor = QTextCursor(doc)
         cursor.select(QTextCursor.SelectionType.Document)
-        block_format = QTextBlockFormat()
-        spacing = line_spacing * 100
-        block_format.setLineHeight(spacing, QTextBlockFormat.LineHeightTypes.ProportionalHeight.value)
-        block_format.setAlignment(alignment)
         cursor.mergeBlockFormat(block_format)
         
         # Get the size of the document
@@ -215,6 +234,7 @@ def pyside_word_wrap(text: str, font_input: str, roi_width: int, roi_height: int
             width += 2 * outline_width
             height += 2 * outline_width
         
+        metrics[key] = width, height
         return width, height
 
     mutable_message = text
@@ -231,7 +251,7 @@ def pyside_word_wrap(text: str, font_input: str, roi_width: int, roi_height: int
                 columns -= 1
                 if columns == 0:
                     break
-                mutable_message = '\n'.join(hyphen_wrap(text, columns, break_on_hyphens=False, break_long_words=False, hyphenate_broken_words=True)) 
+                mutable_message = wrap_text(columns)
                 wrapped_width, _ = eval_metrics(mutable_message, font_size)
                 if wrapped_width <= roi_width:
                     break
@@ -250,7 +270,7 @@ def pyside_word_wrap(text: str, font_input: str, roi_width: int, roi_height: int
         min_cost = 1e9
         min_text = text
         for columns in range(1, len(text)):
-            wrapped_text = '\n'.join(hyphen_wrap(text, columns, break_on_hyphens=False, break_long_words=False, hyphenate_broken_words=True))
+            wrapped_text = wrap_text(columns)
             wrapped_width, wrapped_height = eval_metrics(wrapped_text, font_size)
             cost = (wrapped_width - roi_width)**2 + (wrapped_height - roi_height)**2
             if cost < min_cost:
@@ -107,8 +107,9 @@ class BaseLLMTranslation(LLMTranslation):
         if not success:
             raise ValueError(f"Failed to encode image with format {ext}")
         
-        # Convert to base64
-        img_str = base64.b64encode(buffer).decode('utf-8')
+        # Convert to base64 straight from the encoded buffer (no bytes copy);
+        # the output is pure ASCII
+        img_str = base64.b64encode(buffer).decode('ascii')
         
         # Map extension to mime type
         mime_types = {
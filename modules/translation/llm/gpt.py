@@ -5,6 +5,9 @@ import json
 
 from .base import BaseLLMTranslation
 from ...utils.translator_utils import MODEL_MAP
+from ...utils.http_session import create_session
+from ...utils import fast_json
+from ...utils.api_errors import format_api_error, error_from_response_body
 
 
 class GPTTranslation(BaseLLMTranslation):
@@ -18,6 +21,10 @@ class GPTTranslation(BaseLLMTranslation):
         self.temperature = 1.0
         self.max_tokens = 5000
         self.supports_images = True
+        self.timeout = (5, 180)  # (connect, read) seconds; batched pages can take a while
+        self._headers = None
+        self._api_url = None
+        self._session = create_session()
     
     def initialize(self, settings: Any, source_lang: str, target_lang: str, model_name: str, **kwargs) -> None:
         """
@@ -35,6 +42,8 @@ class GPTTranslation(BaseLLMTranslation):
         credentials = settings.get_credentials(settings.ui.tr('Open AI GPT'))
         self.api_key = credentials.get('api_key', '')
         self.model = MODEL_MAP.get(self.model_name)
+        self._headers = None
+        self._api_url = None
     
     def _perform_translation(self, user_prompt: str, system_prompt: str, image: np.ndarray) -> str:
         """
@@ -48,14 +57,10 @@ class GPTTranslation(BaseLLMTranslation):
         Returns:
             Translated text
         """
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        
         if self.supports_images and self.img_as_llm_input:
-            # Use the base class method to encode the image
-            encoded_image, mime_type = self.encode_image(image)
+            # Use the base class method to encode the image; JPEG keeps
+            # the upload small and the model doesn't need lossless input
+            encoded_image, mime_type = self.encode_image(image, ".jpg")
             
             messages = [
                 {
@@ -89,18 +94,37 @@ class GPTTranslation(BaseLLMTranslation):
             "max_tokens": self.max_tokens,
         }
 
-        return self._make_api_request(payload, headers)
+        return self._make_api_request(payload, self._get_headers())
     
-    def _make_api_request(self, payload, headers):
+    def _get_headers(self) -> dict:
         """
-        Make API request and process response
+        Return the request headers, building them once per API key.
         """
-        try:
+        if self._headers is None:
+            self._headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.api_key}"
+            }
+        return self._headers
+    
+    def _get_api_url(self) -> str:
+        """
+        Return the chat completions endpoint, resolving it once per base URL.
+        """
+        if self._api_url is None:
             # Check if the API base URL already contains the /chat/completions endpoint
             if self.api_base_url.endswith('/chat/completions'):
-                api_url = self.api_base_url
+                self._api_url = self.api_base_url
             else:
-                api_url = f"{self.api_base_url}/chat/completions"
+                self._api_url = f"{self.api_base_url}/chat/completions"
+        return self._api_url
+    
+    def _make_api_request(self, payload, headers):
+        """
+        Make API request and process response
+        """
+        try:
+            api_url = self._get_api_url()
                 
             print(f"--- Custom API Request ---")
             print(f"URL: {api_url}")
@@ -108,10 +132,11 @@ class GPTTranslation(BaseLLMTranslation):
             print(f"Payload Model: {payload.get('model')}")
             # print(f"Payload Messages: {json.dumps(payload.get('messages', []), indent=2)[:1000]}...") # Example: limit payload logging
             
-            response = requests.post(
+            response = self._session.post(
                 api_url,
                 headers=headers,
-                data=json.dumps(payload)
+                data=fast_json.dumps(payload),
+                timeout=self.timeout
             )
             
             print(f"--- Custom API Response ---")
@@ -121,21 +146,11 @@ class GPTTranslation(BaseLLMTranslation):
             
             response.raise_for_status() # Raise HTTP errors after printing
             
-            response_data = response.json()
+            response_data = fast_json.loads(response.content)
             
             # First check for error responses
             if "error" in response_data:
-                error_info = response_data["error"]
-                error_message = error_info.get("message", "Unknown API error")
-                error_code = error_info.get("code", "unknown")
-                
-                # Handle rate limiting specifically
-                if error_code == 429 or "rate limit" in error_message.lower():
-                    provider = error_info.get("metadata", {}).get("provider_name", "API provider")
-                    raise RuntimeError(f"Rate limit exceeded for {provider}: {error_message}")
-                
-                # Handle other errors
-                raise RuntimeError(f"API error ({error_code}): {error_message}")
+                raise RuntimeError(format_api_error(response_data["error"]))
             
             # Handle different API response formats
             if "choices" in response_data:
@@ -163,23 +178,17 @@ class GPTTranslation(BaseLLMTranslation):
         except requests.exceptions.RequestException as e:
             error_msg = f"API request failed: {str(e)}"
             if hasattr(e, 'response') and e.response is not None:
+                # Parse the error body once; fall back to the raw text if it
+                # isn't a JSON error object
                 try:
-                    error_details = e.response.json()
-                    if "error" in error_details:
-                        # Extract and format error information if available
-                        error_info = error_details["error"]
-                        error_message = error_info.get("message", "Unknown error")
-                        error_code = error_info.get("code", e.response.status_code)
-                        
-                        # Special handling for rate limit errors
-                        if error_code == 429 or "rate limit" in error_message.lower():
-                            provider = error_info.get("metadata", {}).get("provider_name", "API provider")
-                            error_msg = f"Rate limit exceeded for {provider}: {error_message}"
-                        else:
-                            error_msg = f"API error ({error_code}): {error_message}"
+                    api_error = error_from_response_body(e.response.content, e.response.status_code)
+                    if api_error:
+                        error_msg = api_error
+                    elif e.response.text:
+                        error_msg += f" - {e.response.text[:500]}"
                     else:
-                        error_msg += f" - {json.dumps(error_details)}"
-                except:
+                        error_msg += f" - Status code: {e.response.status_code}"
+                except (ValueError, KeyError):
                     error_msg += f" - Status code: {e.response.status_code}"
             # Also print the raw response text on general request exceptions
             print(f"--- Custom API Request Exception ---")
@@ -0,0 +1,51 @@
+from typing import Any, Optional
+
+from . import fast_json
+
+
+def format_api_error(error_info: Any, default_code: Any = "unknown") -> str:
+    """
+    Build a readable message from the "error" object of an API response.
+    
+    Args:
+        error_info: Value of the "error" key (usually a dict, sometimes a string)
+        default_code: Code to report when the error has none
+        
+    Returns:
+        Formatted error message
+    """
+    if not isinstance(error_info, dict):
+        error_info = {"message": str(error_info)}
+    
+    # APIs may send explicit nulls, so fall back on falsy values rather than missing keys
+    error_message = str(error_info.get("message") or "Unknown API error")
+    error_code = error_info.get("code", default_code)
+    
+    # Handle rate limiting specifically
+    if error_code == 429 or "rate limit" in error_message.lower():
+        metadata = error_info.get("metadata")
+        provider = metadata.get("provider_name", "API provider") if isinstance(metadata, dict) else "API provider"
+        return f"Rate limit exceeded for {provider}: {error_message}"
+    
+    return f"API error ({error_code}): {error_message}"
+
+
+def error_from_response_body(content: bytes, default_code: Any = "unknown") -> Optional[str]:
+    """
+    Parse an error response body once and format its "error" object.
+    
+    Args:
+        content: Raw response body
+        default_code: Code to report when the error has none (e.g. the HTTP status)
+        
+    Returns:
+        Formatted error message, or None if the body isn't JSON or has no "error"
+    """
+    try:
+        error_details = fast_json.loads(content)
+    except fast_json.JSONDecodeError:
+        return None
+    
+    if not isinstance(error_details, dict) or "error" not in error_details:
+        return None
+    return format_api_error(error_details["error"], default_code)
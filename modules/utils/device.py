@@ -0,0 +1,65 @@
+from functools import lru_cache
+from typing import Optional
+
+
+# Querying the CUDA driver is expensive (each call goes through
+# cudaGetDeviceCount/cudaGetDeviceProperties), so results are cached
+# for the lifetime of the process.
+_CUDA_AVAILABLE: Optional[bool] = None
+_CUDA_DEVICE_COUNT: Optional[int] = None
+_CUDA_DEVICE_NAMES: dict[int, str] = {}
+
+
+def cuda_available() -> bool:
+    """Return whether CUDA is usable by torch, querying the driver only once."""
+    global _CUDA_AVAILABLE
+    if _CUDA_AVAILABLE is None:
+        try:
+            import torch
+            _CUDA_AVAILABLE = torch.cuda.is_available()
+        except ImportError:
+            _CUDA_AVAILABLE = False
+    return _CUDA_AVAILABLE
+
+
+def cuda_device_count() -> int:
+    """Return the number of visible CUDA devices (0 if CUDA is unavailable)."""
+    global _CUDA_DEVICE_COUNT
+    if _CUDA_DEVICE_COUNT is None:
+        if cuda_available():
+            import torch
+            _CUDA_DEVICE_COUNT = torch.cuda.device_count()
+        else:
+            _CUDA_DEVICE_COUNT = 0
+    return _CUDA_DEVICE_COUNT
+
+
+def cuda_device_name(index: int = 0) -> str:
+    """Return the name of the CUDA device at ``index``."""
+    if index not in _CUDA_DEVICE_NAMES:
+        import torch
+        _CUDA_DEVICE_NAMES[index] = torch.cuda.get_device_name(index)
+    return _CUDA_DEVICE_NAMES[index]
+
+
+@lru_cache(maxsize=1)
+def ensure_cuda_ready() -> bool:
+    """
+    Report CUDA details the first time a GPU-backed model is about to run.
+
+    torch initializes the CUDA context lazily on first use, so this only
+    queries (and logs) the device state instead of forcing torch.cuda.init().
+
+    Returns:
+        Whether CUDA is available
+    """
+    available = cuda_available()
+    print(f"torch.cuda.is_available() returned: {available}")
+    if available:
+        device_count = cuda_device_count()
+        print(f"CUDA Check: Device Count: {device_count}")
+        if device_count > 0:
+            print(f"CUDA Check: Device Name (GPU 0): {cuda_device_name(0)}")
+    else:
+        print("CUDA Check: CUDA NOT AVAILABLE according to torch.cuda.is_available()")
+    return available
@@ -0,0 +1,27 @@
+# orjson is much faster than the stdlib on the large base64 payloads sent to
+# the vision APIs; fall back to json when it isn't installed.
+try:
+    import orjson
+
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj) -> bytes:
+        """Serialize ``obj`` to UTF-8 encoded JSON bytes."""
+        return orjson.dumps(obj)
+
+    def loads(data):
+        """Deserialize JSON from ``bytes`` or ``str``."""
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    JSONDecodeError = json.JSONDecodeError
+
+    def dumps(obj) -> bytes:
+        """Serialize ``obj`` to UTF-8 encoded JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def loads(data):
+        """Deserialize JSON from ``bytes`` or ``str``."""
+        return json.loads(data)
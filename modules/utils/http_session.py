@@ -0,0 +1,123 @@
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Shared by the requests session and the httpx client
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def create_session(pool_connections: int = 8, pool_maxsize: int = 16) -> requests.Session:
+    """
+    Create a requests Session that keeps connections alive between calls.
+
+    Reusing one session per engine avoids a new TCP + TLS handshake for every
+    request. Transient failures (rate limits, 5xx) are retried with backoff.
+
+    Args:
+        pool_connections: Number of host connection pools to cache
+        pool_maxsize: Maximum number of connections kept per host
+
+    Returns:
+        Configured requests Session
+    """
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=sorted(RETRY_STATUSES),
+        allowed_methods=frozenset({"GET", "POST"}),
+        # Hand the last response back to the caller instead of raising,
+        # so the engines can report the API's own error message
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def create_http2_client(connect_timeout: float = 5.0, read_timeout: float = 60.0,
+                        max_connections: int = 16, max_keepalive_connections: int = 8):
+    """
+    Create an httpx Client that multiplexes concurrent requests over HTTP/2.
+
+    The client is thread-safe, so worker threads can share it and their
+    requests travel as streams on one connection instead of each needing
+    its own. Connection failures are retried by the transport; send requests
+    through post_with_retry to also retry rate limits and 5xx responses.
+
+    Args:
+        connect_timeout: Seconds allowed to establish a connection
+        read_timeout: Seconds allowed to wait for the response
+        max_connections: Maximum number of open connections
+        max_keepalive_connections: Maximum number of idle connections kept
+
+    Returns:
+        httpx.Client, or None if httpx with HTTP/2 support isn't installed
+    """
+    try:
+        import httpx
+        import h2  # noqa: F401  (required by httpx for http2=True)
+    except ImportError:
+        return None
+
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+    transport = httpx.HTTPTransport(http2=True, retries=3, limits=limits)
+    return httpx.Client(transport=transport, timeout=httpx.Timeout(connect_timeout, read=read_timeout))
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def post_with_retry(client, url: str, retries: int = RETRY_TOTAL,
+                    backoff_factor: float = RETRY_BACKOFF_FACTOR, **kwargs):
+    """
+    POST with an httpx Client, retrying rate limits and 5xx responses.
+
+    Mirrors the Retry policy of create_session: exponential backoff between
+    attempts, Retry-After honoured when the server sends it, and the last
+    response returned (not raised) so callers can report the API's own error.
+
+    Args:
+        client: httpx.Client to send the request with
+        url: Request URL
+        retries: Number of retries after the first attempt
+        backoff_factor: Base delay in seconds, doubled on every retry
+        **kwargs: Passed on to client.post
+
+    Returns:
+        httpx.Response
+    """
+    for attempt in range(retries + 1):
+        response = client.post(url, **kwargs)
+        if response.status_code not in RETRY_STATUSES or attempt == retries:
+            return response
+        delay = _retry_after_seconds(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = backoff_factor * (2 ** attempt)
+        response.close()
+        time.sleep(delay)
+    return response
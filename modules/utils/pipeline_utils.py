@@ -2,6 +2,7 @@ import cv2
 import numpy as np
 import os
 import base64
+from functools import lru_cache
 
 from .textblock import TextBlock, sort_textblock_rectangles
 from ..detection.utils.general import does_rectangle_fit, is_mostly_contained
@@ -49,17 +50,22 @@ inpaint_map = {
     "AOT": AOT,
 }
 
-def get_config(settings_page):
+@lru_cache(maxsize=8)
+def _config_kwargs(settings_page, settings_version: int) -> dict:
+    # settings_version is only part of the cache key; it changes whenever
+    # a settings widget does
     strategy_settings = settings_page.get_hd_strategy_settings()
     if strategy_settings['strategy'] == settings_page.ui.tr("Resize"):
-        config = Config(hd_strategy="Resize", hd_strategy_resize_limit = strategy_settings['resize_limit'])
+        return dict(hd_strategy="Resize", hd_strategy_resize_limit = strategy_settings['resize_limit'])
     elif strategy_settings['strategy'] == settings_page.ui.tr("Crop"):
-        config = Config(hd_strategy="Crop", hd_strategy_crop_margin = strategy_settings['crop_margin'],
-                        hd_strategy_crop_trigger_size = strategy_settings['crop_trigger_size'])
-    else:
-        config = Config(hd_strategy="Original")
+        return dict(hd_strategy="Crop", hd_strategy_crop_margin = strategy_settings['crop_margin'],
+                    hd_strategy_crop_trigger_size = strategy_settings['crop_trigger_size'])
+    return dict(hd_strategy="Original")
 
-    return config
+def get_config(settings_page):
+    # Inpainters may adjust the config they're given (MI-GAN does), so only the
+    # widget reads are cached and each caller gets its own Config
+    return Config(**_config_kwargs(settings_page, settings_page.settings_version))
 
 def get_language_code(lng: str):
     lng_cd = language_codes.get(lng, None)
@@ -100,9 +106,26 @@ def lists_to_blk_list(blk_list: list[TextBlock], texts_bboxes: list, texts_strin
 
     return blk_list
 
-def generate_mask(img: np.ndarray, blk_list: list[TextBlock], default_padding: int = 5) -> np.ndarray:
-    h, w, c = img.shape
-    mask = np.zeros((h, w), dtype=np.uint8)  # Start with a black mask
+def generate_mask(img: np.ndarray, blk_list: list[TextBlock], default_padding: int = 5, out: np.ndarray = None) -> np.ndarray:
+    """
+    Build the inpainting mask for blk_list.
+
+    Args:
+        img: Image the mask is for
+        blk_list: Blocks whose inpaint_bboxes are masked
+        default_padding: Dilation kernel size used for ja/ko text
+        out: Optional uint8 buffer at least as large as img to draw into,
+            so batches don't allocate a new mask for every page
+
+    Returns:
+        H x W uint8 mask (a view into out when it is given)
+    """
+    h, w = img.shape[:2]
+    if out is None:
+        mask = np.zeros((h, w), dtype=np.uint8)  # Start with a black mask
+    else:
+        mask = out[:h, :w]
+        mask.fill(0)
     
     for blk in blk_list:
         bboxes = blk.inpaint_bboxes
@@ -126,19 +149,21 @@ def generate_mask(img: np.ndarray, blk_list: list[TextBlock], default_padding: i
                 # Adjust kernel size if necessary
                 if kernel_size >= min_distance_to_bbox:
                     kernel_size = max(1, int(min_distance_to_bbox - (0.2 * min_distance_to_bbox)))
-            
-            # Create a temporary mask for this bbox
-            temp_mask = np.zeros((h, w), dtype=np.uint8)
-            cv2.rectangle(temp_mask, (x1, y1), (x2, y2), 255, -1)
-            
-            # Create kernel for dilation
-            kernel = np.ones((kernel_size, kernel_size), np.uint8)
-            
-            # Dilate the temporary mask
-            dilated_mask = cv2.dilate(temp_mask, kernel, iterations=4)
-            
-            # Add the dilated mask to the main mask
-            mask = cv2.bitwise_or(mask, dilated_mask)
+
+            # Dilating a filled rectangle 4 times with a kernel_size square kernel
+            # (anchor at kernel_size // 2) just grows it, so the grown rectangle is
+            # filled directly instead of dilating a full-size temporary mask.
+            # Clip first: parts of the box outside the image don't dilate inwards.
+            left, right = sorted((int(x1), int(x2)))
+            top, bottom = sorted((int(y1), int(y2)))
+            left, top = max(left, 0), max(top, 0)
+            right, bottom = min(right, w - 1), min(bottom, h - 1)
+            if left > right or top > bottom:
+                continue
+            grow_before = 4 * (kernel_size - 1 - kernel_size // 2)
+            grow_after = 4 * (kernel_size // 2)
+            mask[max(top - grow_before, 0):bottom + grow_after + 1,
+                 max(left - grow_before, 0):right + grow_after + 1] = 255
     
     return mask
 
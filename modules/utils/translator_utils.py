@@ -43,6 +43,26 @@ def get_raw_translation(blk_list: List[TextBlock]):
     
     return raw_translations_json
 
+def get_raw_text_and_translation(blk_list: List[TextBlock]):
+    """
+    Build the raw text and raw translation JSON for blk_list in one pass.
+
+    Returns:
+        Tuple of (raw texts JSON, raw translations JSON, raw texts dict,
+        raw translations dict); the dicts are what the JSON strings decode to
+    """
+    rw_txts_dict = {}
+    rw_translations_dict = {}
+    for idx, blk in enumerate(blk_list):
+        block_key = f"block_{idx}"
+        rw_txts_dict[block_key] = blk.text
+        rw_translations_dict[block_key] = blk.translation
+
+    raw_texts_json = json.dumps(rw_txts_dict, ensure_ascii=False, indent=4)
+    raw_translations_json = json.dumps(rw_translations_dict, ensure_ascii=False, indent=4)
+
+    return raw_texts_json, raw_translations_json, rw_txts_dict, rw_translations_dict
+
 def set_texts_from_json(blk_list: List[TextBlock], json_string: str):
     match = re.search(r"\{[\s\S]*\}", json_string)
     if match:
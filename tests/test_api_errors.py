@@ -0,0 +1,26 @@
+from modules.utils.api_errors import format_api_error, error_from_response_body
+
+
+def test_format_api_error_basic():
+    assert format_api_error({"message": "bad key", "code": 401}) == "API error (401): bad key"
+    assert format_api_error("plain text", 500) == "API error (500): plain text"
+
+
+def test_format_api_error_rate_limit():
+    error = {"message": "slow down", "code": 429, "metadata": {"provider_name": "OpenAI"}}
+    assert format_api_error(error) == "Rate limit exceeded for OpenAI: slow down"
+    assert format_api_error({"message": "Rate limit reached"}) == \
+        "Rate limit exceeded for API provider: Rate limit reached"
+
+
+def test_format_api_error_tolerates_nulls_and_odd_metadata():
+    assert format_api_error({"message": None, "code": 429, "metadata": None}) == \
+        "Rate limit exceeded for API provider: Unknown API error"
+    assert format_api_error({"message": "limit", "code": 429, "metadata": "openrouter"}) == \
+        "Rate limit exceeded for API provider: limit"
+
+
+def test_error_from_response_body():
+    assert error_from_response_body(b'{"error": {"message": "nope"}}', 400) == "API error (400): nope"
+    assert error_from_response_body(b'{"result": 1}', 400) is None
+    assert error_from_response_body(b'<html>bad gateway</html>', 502) is None
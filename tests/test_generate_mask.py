@@ -0,0 +1,57 @@
+import random
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from modules.utils.pipeline_utils import generate_mask
+
+
+def reference_mask(h, w, boxes):
+    # Original implementation: full-size mask per box, dilated 4 times
+    mask = np.zeros((h, w), dtype=np.uint8)
+    for x1, y1, x2, y2, kernel_size in boxes:
+        temp_mask = np.zeros((h, w), dtype=np.uint8)
+        cv2.rectangle(temp_mask, (x1, y1), (x2, y2), 255, -1)
+        kernel = np.ones((kernel_size, kernel_size), np.uint8)
+        mask = cv2.bitwise_or(mask, cv2.dilate(temp_mask, kernel, iterations=4))
+    return mask
+
+
+def make_blocks(boxes):
+    # generate_mask picks the kernel from the block, so use one block per box
+    # with default_padding set to that box's kernel size via source_lang 'ja'
+    return [
+        SimpleNamespace(inpaint_bboxes=[(x1, y1, x2, y2)], source_lang='ja',
+                        text_class='text_free', bubble_xyxy=None)
+        for x1, y1, x2, y2, _ in boxes
+    ]
+
+
+def test_generate_mask_matches_dilation():
+    rng = random.Random(0)
+    scratch = np.full((120, 120), 7, dtype=np.uint8)
+    for iteration in range(3000):
+        h, w = rng.randint(5, 100), rng.randint(5, 100)
+        kernel_size = rng.randint(1, 9)
+        boxes = [
+            (rng.randint(-20, w + 20), rng.randint(-20, h + 20),
+             rng.randint(-20, w + 20), rng.randint(-20, h + 20), kernel_size)
+            for _ in range(rng.randint(0, 4))
+        ]
+        img = np.zeros((h, w, 3), dtype=np.uint8)
+        out = scratch if iteration % 2 else None  # Dirty scratch buffer must be cleared
+        mask = generate_mask(img, make_blocks(boxes), default_padding=kernel_size, out=out)
+
+        assert mask.shape == (h, w)
+        assert np.array_equal(mask, reference_mask(h, w, boxes)), (h, w, boxes)
+
+
+def test_generate_mask_uses_out_buffer():
+    scratch = np.full((50, 60), 255, dtype=np.uint8)
+    img = np.zeros((30, 40, 3), dtype=np.uint8)
+    mask = generate_mask(img, [], out=scratch)
+
+    assert mask.shape == (30, 40)
+    assert np.shares_memory(mask, scratch)
+    assert not mask.any()
@@ -0,0 +1,49 @@
+import json
+from types import SimpleNamespace
+
+from modules.ocr.gpt_ocr import GPTOCR, _BATCH_SEPARATOR
+
+
+def make_ocr(replies):
+    """GPTOCR whose _post returns the queued reply texts in order."""
+    ocr = GPTOCR()
+    ocr.initialize("test-key")
+    requests = []
+
+    def fake_post(body):
+        requests.append(json.loads(body))
+        content = json.dumps({"choices": [{"message": {"content": replies.pop(0)}}]}).encode()
+        return SimpleNamespace(status_code=200, content=content, text=content.decode())
+
+    ocr._post = fake_post
+    return ocr, requests
+
+
+def test_ocr_batch_splits_one_result_per_image():
+    reply = f"{_BATCH_SEPARATOR}\nfirst\nline\n{_BATCH_SEPARATOR}\n\n{_BATCH_SEPARATOR}\nthird\n{_BATCH_SEPARATOR}"
+    ocr, requests = make_ocr([reply])
+
+    assert ocr._ocr_batch(["a", "b", "c"]) == ["first line", "", "third"]
+    assert len(requests) == 1
+    images = [part for part in requests[0]["messages"][0]["content"] if part["type"] == "image_url"]
+    assert [part["image_url"]["url"] for part in images] == ["a", "b", "c"]
+
+
+def test_ocr_batch_falls_back_per_image_on_count_mismatch():
+    ocr, requests = make_ocr([f"one{_BATCH_SEPARATOR}two", "A", "B", "C"])
+
+    assert ocr._ocr_batch(["a", "b", "c"]) == ["A", "B", "C"]
+    assert len(requests) == 4
+
+
+def test_ocr_batch_replicates_errors():
+    ocr, _ = make_ocr(["[OCR Error: boom]"])
+
+    assert ocr._ocr_batch(["a", "b"]) == ["[OCR Error: boom]"] * 2
+
+
+def test_ocr_batch_single_image_uses_plain_prompt():
+    ocr, requests = make_ocr(["hello\nworld"])
+
+    assert ocr._ocr_batch(["a"]) == ["hello world"]
+    assert _BATCH_SEPARATOR not in requests[0]["messages"][0]["content"][0]["text"]
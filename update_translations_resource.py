@@ -1,5 +1,6 @@
 import os
-import re
+import mmap
+import shutil
 from pathlib import Path
 
 def main():
@@ -10,24 +11,22 @@ def main():
         print(f"Error: {translations_py} does not exist!")
         return 1
     
-    # Read the current file
-    with open(translations_py, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Add the Georgian file to the resource name section
-    name_pattern = r'qt_resource_name = b"(.*?)"'
-    name_match = re.search(name_pattern, content, re.DOTALL)
-    
-    if not name_match:
-        print("Error: Could not find qt_resource_name section in the file!")
-        return 1
-    
-    current_names = name_match.group(1)
-    
-    # Check if Georgian is already included
-    if b"ct_ka.qm" in current_names.encode('utf-8'):
-        print("Georgian translation is already included in the resource file.")
-        return 0
+    # Map the file instead of reading it; it holds megabytes of packed resource data
+    with open(translations_py, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Add the Georgian file to the resource name section
+        name_marker = b'qt_resource_name = b"'
+        names_start = mm.find(name_marker)
+        names_end = mm.find(b'"', names_start + len(name_marker)) if names_start != -1 else -1
+
+        if names_end == -1:
+            print("Error: Could not find qt_resource_name section in the file!")
+            return 1
+
+        # Check if Georgian is already included
+        if mm.find(b"ct_ka.qm", names_start + len(name_marker), names_end) != -1:
+            print("Georgian translation is already included in the resource file.")
+            return 0
     
     # Add Georgian translation to the list
     # This is a complex operation because we need to add a new entry to the resource list
@@ -35,8 +34,7 @@ def main():
     
     print("Creating a backup of the original file...")
     backup_file = translations_py.with_suffix('.py.bak')
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    shutil.copyfile(translations_py, backup_file)
     
     print("Manual steps required:")
     print("1. Use Qt's resource compiler (rcc) to add the Georgian translation file.")